@@ -0,0 +1,9 @@
+import warnings
+import mpmath
+
+# gmpy2 is required (FREnumerator uses it directly), and mpmath picks it up as its backend automatically.
+# mpmath can still be forced off the gmpy backend (e.g. by setting MPMATH_NOGMPY), in which case mpf operations, logs
+# and PSLQ run on python ints and are several times slower. This check catches that.
+if mpmath.libmp.BACKEND != 'gmpy':
+    warnings.warn(f"mpmath is using the '{mpmath.libmp.BACKEND}' backend instead of gmpy, which makes it much slower. "
+                  "gmpy2 is required by FREnumerator; make sure it is installed and MPMATH_NOGMPY is not set.")
@@ -1,5 +1,8 @@
 import math
+import multiprocessing
 import mpmath
+import gmpy2
+from gmpy2 import mpz
 
 from .RelativeGCFEnumerator import RelativeGCFEnumerator
 from collections import namedtuple
@@ -24,51 +27,66 @@ def check_for_fr(an_iterator, bn_iterator, an_deg, burst_number=BURST_NUMBER, mi
     Reduction).
     This function test if a GCF has factorial reduction.
     """
-    calculated_values = []
+    # only the last three calculated values are used, so we keep them in a rolling buffer (v2 is the newest)
+    v0 = v1 = v2 = 0.
     num_of_calculated_vals = 0
 
-    prev_q = 0
-    q = 1
-    prev_p = 1
+    # p and q grow super exponentially, so we keep them as gmpy2 integers for faster arithmetic and GCD
+    prev_q = mpz(0)
+    q = mpz(1)
+    prev_p = mpz(1)
     
-    p = next(an_iterator)  # will place a[0] to p
+    p = mpz(next(an_iterator))  # will place a[0] to p
     next(bn_iterator)  # b0 is discarded
 
-    next_gcd_calculation = burst_number if burst_number >= min_iters else min_iters
-
-    for i, (a_i, b_i) in enumerate(zip(an_iterator, bn_iterator)):
-        tmp_a = q
-        tmp_b = p
-
-        q = a_i * q + b_i * prev_q
-        p = a_i * p + b_i * prev_p
-
-        prev_q = tmp_a
-        prev_p = tmp_b
-
-        if i == next_gcd_calculation:
-            num_of_calculated_vals += 1
-            next_gcd_calculation += burst_number
-
-            calculated_values.append(
-                mpmath.log(mpmath.mpf(math.gcd(p, q))) / mpmath.mpf(i) +
-                an_deg * (-mpmath.log(i) + 1)
-            )
-
-            # The calculated value will converge for GCFs that have FR, but it will not happen monotonically.
-            # We're calculating values once every burst_number iterations, to try and avoid fluctuations' effect
-            # If the value still isn't converging to a steady value, we'll halt the calculation early.
-            # TODO - add a reference to Guy & Nadav's paper once its on arxiv
-            if num_of_calculated_vals >= 3 and \
-                    abs(calculated_values[-2] - calculated_values[-1]) > \
-                    abs(calculated_values[-2] - calculated_values[-3]):
-                return False, i
+    # log of the common factor we've divided p, q, prev_p and prev_q by so far
+    removed_log_gcd = 0.
 
-            if num_of_calculated_vals >= 2 and \
-                    abs(calculated_values[-2] - calculated_values[-1]) < CONVERGENCE_THRESHOLD:
-                return True, i
+    next_gcd_calculation = burst_number if burst_number >= min_iters else min_iters
 
-    return False, i
+    items = zip(an_iterator, bn_iterator)
+    i = -1
+    while True:
+        # The recurrence runs uninterrupted until the next checkpoint, GCD is only computed once per burst.
+        # gmpy2.gcd uses GMP's sub-quadratic GCD, which matters since p and q have thousands of bits at this point.
+        for i, (a_i, b_i) in zip(range(i + 1, next_gcd_calculation + 1), items):
+            # tuple assignment saves the temporaries' stores and loads on every step
+            q, prev_q = a_i * q + b_i * prev_q, q
+            p, prev_p = a_i * p + b_i * prev_p, p
+
+        if i != next_gcd_calculation:
+            # series items ran out before reaching the next checkpoint
+            return False, i
+
+        num_of_calculated_vals += 1
+        next_gcd_calculation += burst_number
+
+        # Only a few digits are needed to test convergence, so we use double precision logs. gmpy2.log is used for
+        # the GCD since it may be too big to be converted to a float.
+        gcd = gmpy2.gcd(p, q)
+        v0, v1, v2 = v1, v2, (removed_log_gcd + float(gmpy2.log(gcd))) / i + an_deg * (-math.log(i) + 1)
+
+        # The recurrence is linear, so dividing p, q, prev_p and prev_q by a common factor divides all of the following
+        # items by that factor as well. For GCFs with FR most of gcd(p, q) is such a common factor, so removing it
+        # keeps the numbers much smaller for the rest of the calculation. We only keep track of its log.
+        common_factor = gmpy2.gcd(gmpy2.gcd(gcd, prev_p), prev_q)
+        if common_factor > 1:
+            p = gmpy2.divexact(p, common_factor)
+            q = gmpy2.divexact(q, common_factor)
+            prev_p = gmpy2.divexact(prev_p, common_factor)
+            prev_q = gmpy2.divexact(prev_q, common_factor)
+            removed_log_gcd += float(gmpy2.log(common_factor))
+
+        # The calculated value will converge for GCFs that have FR, but it will not happen monotonically.
+        # We're calculating values once every burst_number iterations, to try and avoid fluctuations' effect
+        # If the value still isn't converging to a steady value, we'll halt the calculation early.
+        # TODO - add a reference to Guy & Nadav's paper once its on arxiv
+        last_diff = abs(v1 - v2)
+        if num_of_calculated_vals >= 3 and last_diff > abs(v1 - v0):
+            return False, i
+
+        if num_of_calculated_vals >= 2 and last_diff < CONVERGENCE_THRESHOLD:
+            return True, i
 
 
 class FREnumerator(RelativeGCFEnumerator):
@@ -79,14 +97,24 @@ class FREnumerator(RelativeGCFEnumerator):
     The computed values are then fed into a PSLQ that tries to find a suitable LHS.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, number_of_processes=1, **kwargs):
+        """
+        number_of_processes - the FR test of the first enumeration and the PSLQ step will be split to this number of
+            processes.
+            Should be left as 1 when the enumerator is already executed inside a pool (e.g. multiprocess_enumeration),
+            since pool processes are not allowed to spawn processes of their own.
+        """
         print('checking for FR enumerator')
         super().__init__(None, *args, **kwargs)
+        self.number_of_processes = number_of_processes
 
     def _first_enumeration(self, print_results: bool):
         """
         Test all GCFs in the domain for FR.
         """
+        if self.number_of_processes > 1:
+            return self._first_enumeration_multiprocess(print_results)
+
         results = []  # list of intermediate results        
         for an_iter, bn_iter, metadata in self._iter_domains_with_cache(FIRST_ENUMERATION_MAX_DEPTH):
             has_fr, items_calculated = check_for_fr(an_iter, bn_iter, self.poly_domains.get_an_degree(metadata.an_coef))
@@ -98,6 +126,23 @@ class FREnumerator(RelativeGCFEnumerator):
 
         return results
 
+    def _first_enumeration_multiprocess(self, print_results: bool):
+        """
+        The FR test of every GCF is independent of the others, so we split the domain and test each sub-domain
+        in a different process.
+        """
+        arguments = [
+            (sub_domain, self.const_sym, print_results)
+            for sub_domain in self.poly_domains.split_domains_to_processes(self.number_of_processes)]
+
+        with multiprocessing.Pool(processes=self.number_of_processes) as pool:
+            process_results = pool.starmap(_single_process_first_enumeration, arguments)
+
+        results = []
+        for r in process_results:
+            results += r
+        return results
+
     def _improve_results_precision(self, intermediate_results, verbose=True):
         """
         Calculates GCFs to a higher depth using RelativeGCFEnumerator's implementation.
@@ -115,42 +160,67 @@ class FREnumerator(RelativeGCFEnumerator):
         self.precise_intermediate_results = precise_intermediate_results
 
         print('Running PSLQ')
-        pslq_results = []
         # The expression PSLQ tries to find is
         # (a + b * const) / (c + d * const) = val
         # => a + b*const -c*val -d*const*val = 0
         # The first two items are identical for all matches. The last two are calculated for each value
-        numer_items = [1] + [gen() for gen in self.constants_generator]
-        num_of_items = len(numer_items)
-
-        for match, val, precision in precise_intermediate_results:
-            try:
-                mpf_val = mpmath.mpf(val)
-                denom_items = [-mpf_val * c for c in numer_items]
-                pslq_res = mpmath.pslq(
-                    numer_items + denom_items, tol=10 ** (2 - precision),
-                    maxcoeff=1_000, maxsteps=1_000)
-
-                if pslq_res:
-                    # Sometimes, PSLQ can find several results for the same value (e.g. z(3)/(z(3)^2) = 1/z(3))
-                    # we'll reduce fraction found to get uniform results
-                    reduced_num, reduced_denom = get_reduced_fraction(
-                        pslq_res[:num_of_items], pslq_res[num_of_items:], num_of_items - 1)
-                    print(f'Found result! an = {match.rhs_an_poly}, bn = {match.rhs_bn_poly}')
-                    print(f'Numerator coefficients = {reduced_num}, Denominator coefficients = {reduced_denom}')
-                else:
-                    reduced_num, reduced_denom = [], []
-
-            except Exception as e:
-                print(f'Exception when using plsq on PCF {match}, {mpmath.nstr(mpf_val, 30)} with constant' +
-                      f'{self.const_sym}')
-                print(e)
-                print('Result saved with None as PSLQ coefficients')
-                reduced_num, reduced_denom = None, None
-
-            pslq_results.append(RefinedMatch(*match, val, reduced_num, reduced_denom, precision))
+        # Converted to mpf once here, since mpmath.pslq converts every item it gets on each call
+        numer_items = [mpmath.mpf(1)] + [gen() for gen in self.constants_generator]
+
+        # PSLQ of every match is independent of the others. Child processes don't share our mpmath context, so the
+        # working precision is passed along with the data.
+        arguments = [
+            (match, val, precision, numer_items, self.const_sym, mpmath.mp.dps)
+            for match, val, precision in precise_intermediate_results]
+
+        if self.number_of_processes > 1:
+            with multiprocessing.Pool(processes=self.number_of_processes) as pool:
+                pslq_results = pool.starmap(_single_match_pslq, arguments)
+        else:
+            pslq_results = [_single_match_pslq(*args) for args in arguments]
 
         return pslq_results
 
     def _refine_results(self, intermediate_results, print_results=True):
         return intermediate_results
+
+
+def _single_process_first_enumeration(poly_domains, sym_constants, print_results):
+    enumerator = FREnumerator(poly_domains, sym_constants)
+    return enumerator._first_enumeration(print_results)
+
+
+def _single_match_pslq(match, val, precision, numer_items, sym_constants, dps):
+    """
+    Runs PSLQ over a match's value and the constants (see FREnumerator._improve_results_precision), and returns
+    the match as a RefinedMatch.
+    """
+    num_of_items = len(numer_items)
+    with mpmath.workdps(dps):
+        try:
+            mpf_val = mpmath.mpf(val)
+            neg_val = -mpf_val
+            # numer_items[0] is 1, so there's no need to multiply it
+            denom_items = [neg_val] + [neg_val * c for c in numer_items[1:]]
+            pslq_res = mpmath.pslq(
+                numer_items + denom_items, tol=10 ** (2 - precision),
+                maxcoeff=1_000, maxsteps=1_000)
+
+            if pslq_res:
+                # Sometimes, PSLQ can find several results for the same value (e.g. z(3)/(z(3)^2) = 1/z(3))
+                # we'll reduce fraction found to get uniform results
+                reduced_num, reduced_denom = get_reduced_fraction(
+                    pslq_res[:num_of_items], pslq_res[num_of_items:], num_of_items - 1)
+                print(f'Found result! an = {match.rhs_an_poly}, bn = {match.rhs_bn_poly}')
+                print(f'Numerator coefficients = {reduced_num}, Denominator coefficients = {reduced_denom}')
+            else:
+                reduced_num, reduced_denom = [], []
+
+        except Exception as e:
+            print(f'Exception when using plsq on PCF {match}, {mpmath.nstr(mpf_val, 30)} with constant' +
+                  f'{sym_constants}')
+            print(e)
+            print('Result saved with None as PSLQ coefficients')
+            reduced_num, reduced_denom = None, None
+
+    return RefinedMatch(*match, val, reduced_num, reduced_denom, precision)
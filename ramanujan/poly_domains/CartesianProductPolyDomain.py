@@ -1,13 +1,24 @@
 from .AbstractPolyDomains import AbstractPolyDomains
 from ..utils.utils import iter_series_items_from_compact_poly
 from itertools import product
-from copy import deepcopy
+from copy import copy
 from numpy import array_split
 
 CHECKPOINT_DUMP_SIZE = 5_000
 ALLOW_LOWER_DEGREE = False
 
 
+def _reduce_deg_by_leading_zeros(coefs, deg):
+    """
+    Returns the given degree, reduced by one for every leading zero coefficient.
+    """
+    for coef in coefs:
+        if coef != 0:
+            return deg
+        deg -= 1
+    return deg
+
+
 class CartesianProductPolyDomain(AbstractPolyDomains):
     """
     This poly domain will generate all combinations for a(n) and b(n) coefficients without complex dependence between
@@ -80,37 +91,16 @@ class CartesianProductPolyDomain(AbstractPolyDomains):
 
     def get_an_degree(self, an_coefs):
         if ALLOW_LOWER_DEGREE:
-            deg = self.a_deg
-            for i in an_coefs:
-                if i == 0:
-                    deg -= 1
-                else:
-                    break
-            return deg
+            return _reduce_deg_by_leading_zeros(an_coefs, self.a_deg)
 
         return self.a_deg
 
     def get_bn_degree(self, bn_coefs):
         if ALLOW_LOWER_DEGREE:
-            deg = self.b_deg
-            for i in bn_coefs:
-                if i == 0:
-                    deg -= 1
-                else:
-                    break
-            return deg
+            return _reduce_deg_by_leading_zeros(bn_coefs, self.b_deg)
 
         return self.b_deg
 
-    @staticmethod
-    def _get_compact_poly_deg(coefs):
-        deg = len(coefs) - 1
-        for coef in coefs:
-            if coef != 0:
-                return deg
-            else:
-                deg -= 1
-
     @staticmethod
     def get_calculation_method():
         # both an and bn are regular compact polys
@@ -148,13 +138,6 @@ class CartesianProductPolyDomain(AbstractPolyDomains):
         fit the caching mechanism. Only the nested series needs to be cached.
         The outer looped series is called pn, and the inner series sn.
         """
-        def _get_coefs_in_order():
-            # Helper function to order pn and sn back to an and bn 
-            if primary_looped_domain == 'a':
-                return pn_coef, sn_coef
-            else:
-                return sn_coef, pn_coef
-
         # setting pn and sn from original series
         if primary_looped_domain == 'a':
             pn_coef_range = self.a_coef_range
@@ -166,16 +149,24 @@ class CartesianProductPolyDomain(AbstractPolyDomains):
         pn_domain = self.expand_coef_range_to_full_domain(pn_coef_range)
         sn_domain = self.expand_coef_range_to_full_domain(sn_coef_range)
 
-        # Discard items that we're already calculated from the outer series
-        pn_iterator = product(*pn_domain)
+        # The inner series is iterated once for every outer item, so its coefficient tuples are generated once and
+        # reused, rather than re-creating the same tuples on every outer iteration. Enumerators cache a series for
+        # each of the inner coefficients anyway, so this doesn't change the memory footprint by much.
+        sn_coefs = list(product(*sn_domain))
+        filter_gcfs = self.filter_gcfs
 
-        items_passed = 0
-        for pn_coef in pn_iterator:
-            sn_iterator = product(*sn_domain)           
-            for sn_coef in sn_iterator:
-                if self.filter_gcfs(*_get_coefs_in_order()):
-                    yield _get_coefs_in_order()
-                items_passed += 1
+        # The loop is duplicated for each order, so pn and sn are ordered back to an and bn without checking
+        # primary_looped_domain on every item
+        if primary_looped_domain == 'a':
+            for an_coef in product(*pn_domain):
+                for bn_coef in sn_coefs:
+                    if filter_gcfs(an_coef, bn_coef):
+                        yield an_coef, bn_coef
+        else:
+            for bn_coef in product(*pn_domain):
+                for an_coef in sn_coefs:
+                    if filter_gcfs(an_coef, bn_coef):
+                        yield an_coef, bn_coef
 
     def get_a_coef_iterator(self):
         return product(*self.an_domain_range)
@@ -220,7 +211,11 @@ class CartesianProductPolyDomain(AbstractPolyDomains):
         for chunk_items in array_split(range(biggest_range['range'][0], biggest_range['range'][1] + 1),
                                        number_of_sub_arrays):
             chunk_range = [int(chunk_items[0]), int(chunk_items[-1])]
-            next_instance = deepcopy(self)
+            # The coefficient ranges are the only state that differs between sub-domains (everything else is
+            # recalculated by _setup_metadata), so a shallow copy with fresh ranges is enough. deepcopy is much slower
+            next_instance = copy(self)
+            next_instance.a_coef_range = [list(coef_range) for coef_range in self.a_coef_range]
+            next_instance.b_coef_range = [list(coef_range) for coef_range in self.b_coef_range]
             if biggest_range['series'] == 'a':
                 next_instance.a_coef_range[biggest_range['index']] = chunk_range
             else:
@@ -59,8 +59,13 @@ def main():
 
     results = enumerator.find_initial_hits()
 
-    with open(RESULTS_FILE_PATH_FORMAT.format(id=unique_id), 'w') as f:
+    # The results file is collected once it exists, so we write it to a temporary file first and rename it.
+    # os.replace is atomic, so a client that crashes mid-write won't leave a truncated results file behind.
+    results_file_path = RESULTS_FILE_PATH_FORMAT.format(id=unique_id)
+    tmp_results_file_path = results_file_path + '.tmp'
+    with open(tmp_results_file_path, 'w') as f:
         json.dump(results, f)
+    os.replace(tmp_results_file_path, results_file_path)
 
 
 if __name__ == '__main__':
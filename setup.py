@@ -7,6 +7,7 @@ setuptools.setup(
     packages=['ramanujan'],
     install_requires=[
         'cycler>=0.10.0',
+        'gmpy2>=2.0.8',
         'kiwisolver>=1.1.0',
         'matplotlib>=3.2.0',
         'mpmath>=1.1.0',
@@ -245,6 +245,32 @@ class APITests(unittest.TestCase):
         self.assertIn(((2, 15), (2,), [54, 0], [-224, 189]), results)
         self.assertIn(((3, -2), (1,), [8, 0], [0, 7]), results)
 
+    def test_fr_enumerator_multiprocessing(self):
+        """
+        This is the same test as test_fr_enumerator, but the FR test and PSLQ are split over several processes
+        """
+        poly_search_domain = Zeta3Domain2(
+            [(1, 3), (-20, 20)],
+            (1, 2))
+
+        enumerator = FREnumerator(
+            poly_search_domain,
+            [g_const_dict['zeta'](3)],
+            number_of_processes=4
+        )
+
+        results = get_testable_data(enumerator.full_execution())
+
+        self.assertEqual(len(results), 8)
+
+        self.assertIn(((1, 0), (1,), [1, 0], [0, 1]), results)
+        self.assertIn(((1, 4), (1,), [1, 0], [-1, 1]), results)
+        self.assertIn(((1, 12), (1,), [8, 0], [-9, 8]), results)
+        self.assertIn(((2, 3), (2,), [2, 0], [-8, 7]), results)
+        self.assertIn(((2, 13), (2,), [], []), results)
+        self.assertIn(((2, 15), (2,), [54, 0], [-224, 189]), results)
+        self.assertIn(((3, -2), (1,), [8, 0], [0, 7]), results)
+
     def test_long_plsq_vector(self):
         # we'll test this feature using zeta5's domain
         poly_search_domain = Zeta5Domain(